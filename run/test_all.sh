@@ -50,10 +50,10 @@ echo
 
 # Run all tests with coverage
 echo -e "${BLUE}🏃 Running all tests with coverage...${NC}"
-echo "Command: pytest tests/ -v --tb=short --cov=sync_icloud_git --cov-report=term-missing"
+echo "Command: pytest tests/ -v --tb=short --run-integration --cov=sync_icloud_git --cov-report=term-missing"
 echo
 
-if pytest tests/ -v --tb=short --cov=sync_icloud_git --cov-report=term-missing; then
+if pytest tests/ -v --tb=short --run-integration --cov=sync_icloud_git --cov-report=term-missing; then
     echo
     echo -e "${GREEN}✅ All tests passed successfully!${NC}"
     exit 0
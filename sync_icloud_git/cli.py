@@ -1,4 +1,5 @@
 """Command line interface for sync-icloud-git."""
+import logging
 import sys
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
@@ -214,6 +215,9 @@ class StepPipeline:
 
 def main():
     """Run the main program."""
+    # Operation modules report progress through logging; show it like the pipeline's own output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     config = SyncConfig.load_config()
     
     # Only print configuration details if verbose mode is enabled
@@ -225,14 +229,15 @@ def main():
     if config.verbose:
         print(f"GitOperations: {git_ops}")
 
-    # Create an instance of CloudSyncOperations with the loaded configuration
-    cloud_ops = CloudSyncOperations(config)
-    if config.verbose:
-        print(f"CloudSyncOperations: {cloud_ops}")
+    # Create an instance of CloudSyncOperations with the loaded configuration;
+    # leaving the block removes its temporary rclone config file
+    with CloudSyncOperations(config) as cloud_ops:
+        if config.verbose:
+            print(f"CloudSyncOperations: {cloud_ops}")
 
-    # Execute the pipeline based on the step parameter
-    pipeline = StepPipeline()
-    success = pipeline.execute(config, git_ops, cloud_ops)
+        # Execute the pipeline based on the step parameter
+        pipeline = StepPipeline()
+        success = pipeline.execute(config, git_ops, cloud_ops)
     
     if success:
         print("\n🎉 Sync operation completed successfully!")
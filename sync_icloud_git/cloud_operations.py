@@ -1,7 +1,9 @@
 """Cloud storage operations module for sync-icloud-git."""
+import logging
 import os
 import tempfile
-from rclone_python import rclone
+
+logger = logging.getLogger(__name__)
 
 
 class CloudSyncOperations:
@@ -23,7 +25,7 @@ class CloudSyncOperations:
         self._setup_rclone_config()
 
         if config.verbose:
-            print(f"Cloud sync configured: {self.rclone_remote_name}:{self.rclone_remote_folder} → {os.path.basename(self.git_repo_path)}")
+            logger.info("Cloud sync configured: %s:%s → %s", self.rclone_remote_name, self.rclone_remote_folder, os.path.basename(self.git_repo_path))
 
     # PUBLIC METHODS
 
@@ -36,17 +38,20 @@ class CloudSyncOperations:
         Raises:
             Exception: If connection fails or remote folder is not accessible
         """
-        print("Testing cloud storage connection...")
+        # Imported here: rclone_python pulls in rich and is only needed once a remote is contacted
+        from rclone_python import rclone
+
+        logger.info("Testing cloud storage connection...")
         remote_path = self._build_remote_path()
 
         try:
             # Use explicit config file for the test
             files = rclone.ls(remote_path, args=['--config', self.rclone_config_file.name])
             file_count = len(files)
-            print(f"✅ Found {file_count} items in remote folder")
+            logger.info("✅ Found %s items in remote folder", file_count)
             return file_count
         except (OSError, ValueError, RuntimeError) as e:
-            print(f"❌ Failed to connect to remote folder '{self.rclone_remote_folder}': {e}")
+            logger.error("❌ Failed to connect to remote folder '%s': %s", self.rclone_remote_folder, e)
             raise
 
     def sync_from_cloud_to_repo(self):
@@ -56,13 +61,22 @@ class CloudSyncOperations:
         Files that have been removed from cloud storage will be removed from the git repository.
         In the end, the git repository will be in sync with cloud storage.
         """
-        print(f"Starting sync from remote folder '{self.rclone_remote_name}:{self.rclone_remote_folder}' to '{self.git_repo_path}'")
+        logger.info("Starting sync from remote folder '%s:%s' to '%s'", self.rclone_remote_name, self.rclone_remote_folder, self.git_repo_path)
 
         # Orchestrate the sync process using private methods
         remote_path = self._build_remote_path()
         self.test_connection()
         self._execute_sync_operation(remote_path)
 
+    def close(self):
+        """Remove the temporary rclone config file.
+
+        Called automatically when the instance is used as a context manager. Safe to call more than once.
+        """
+        self._cleanup_rclone_config()
+        # Forget the file so a later close() or __del__ does not touch the path again
+        self.rclone_config_file = None
+
     # BACKWARD COMPATIBILITY ALIASES (deprecated)
     def test_icloud_connection(self):
         """Deprecated: Use test_connection() instead."""
@@ -76,27 +90,26 @@ class CloudSyncOperations:
 
     def _setup_rclone_config(self):
         """Setup rclone configuration file from config content."""
+        # Check the content up front instead of reading the file back after writing it
+        content = self.rclone_config_content
+        if not content or not content.strip():
+            raise ValueError("Rclone config content is empty")
+
         # Create a temporary config file for rclone
         self.rclone_config_file = tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False)
-        self.rclone_config_file.write(self.rclone_config_content)
+        self.rclone_config_file.write(content)
         self.rclone_config_file.flush()  # Ensure content is written to disk
         self.rclone_config_file.close()
 
-        # Verify the config file was written correctly
-        with open(self.rclone_config_file.name, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if not content.strip():
-                raise ValueError("Rclone config file is empty after write")
-
         if self.config.verbose:
-            print(f"Rclone config ready ({len(content)} chars)")
+            logger.info("Rclone config ready (%s chars)", len(content))
 
     def _cleanup_rclone_config(self):
         """Clean up temporary rclone configuration file."""
         if self.rclone_config_file and os.path.exists(self.rclone_config_file.name):
             os.unlink(self.rclone_config_file.name)
             if self.config.verbose:
-                print("Cleaned up rclone config file")
+                logger.info("Cleaned up rclone config file")
 
     # PRIVATE METHODS - Path and Remote Operations
 
@@ -149,7 +162,7 @@ class CloudSyncOperations:
             self._execute_sync_with_library(remote_path, args)
         except Exception as e:
             # If there's any error, the sync failed - don't try to verify
-            print(f"❌ rclone sync failed: {e}")
+            logger.error("❌ rclone sync failed: %s", e)
             raise RuntimeError(f"Sync operation failed: {e}") from e
         finally:
             # Restore environment variable if it existed
@@ -163,14 +176,14 @@ class CloudSyncOperations:
             remote_path (str): The source remote path
             args (list): Command line arguments for rclone (unused but kept for compatibility)
         """
-        print(f"Syncing from {remote_path} to {self.git_repo_path}...")
+        logger.info("Syncing from %s to %s...", remote_path, self.git_repo_path)
         if self.config.exclude_patterns:
             if len(self.config.exclude_patterns) <= 10:
                 # Show all patterns if 10 or fewer
-                print(f"Excluding {len(self.config.exclude_patterns)} patterns: {', '.join(self.config.exclude_patterns)}")
+                logger.info("Excluding %s patterns: %s", len(self.config.exclude_patterns), ', '.join(self.config.exclude_patterns))
             else:
                 # Show first 8 with "..." if more than 10
-                print(f"Excluding {len(self.config.exclude_patterns)} patterns: {', '.join(self.config.exclude_patterns[:8])}...")
+                logger.info("Excluding %s patterns: %s...", len(self.config.exclude_patterns), ', '.join(self.config.exclude_patterns[:8]))
 
     def _execute_sync_with_library(self, remote_path, args):
         """Execute rclone sync using rclone_python library (preferred approach).
@@ -179,6 +192,8 @@ class CloudSyncOperations:
             remote_path (str): The source remote path
             args (list): Command line arguments for rclone
         """
+        from rclone_python import rclone
+
         # Use rclone_python library directly (same approach as test_rclone.py)
         rclone.sync(
             src_path=remote_path,
@@ -187,13 +202,13 @@ class CloudSyncOperations:
             show_progress=True
         )
 
-        print("✅ rclone sync completed!")
+        logger.info("✅ rclone sync completed!")
         # Quick file count for user feedback
         try:
             synced_files = self._count_synced_files()
-            print(f"{len(synced_files)} files in repository")
+            logger.info("%s files in repository", len(synced_files))
         except (OSError, AttributeError):
-            print(f"Sync to {os.path.basename(self.git_repo_path)} completed")
+            logger.info("Sync to %s completed", os.path.basename(self.git_repo_path))
 
     def _count_synced_files(self):
         """Count files in the destination directory (excluding .git).
@@ -215,10 +230,16 @@ class CloudSyncOperations:
     def __repr__(self):
         return f"CloudSyncOperations(git_repo_path='{self.git_repo_path}', rclone_remote_name='{self.rclone_remote_name}', rclone_remote_folder='{self.rclone_remote_folder}')"
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __del__(self):
-        """Cleanup when object is destroyed."""
+        """Fallback cleanup for instances that were never closed."""
         try:
-            self._cleanup_rclone_config()
+            self.close()
         except (OSError, AttributeError):
             pass  # Ignore cleanup errors during destruction
 
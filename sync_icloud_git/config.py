@@ -1,31 +1,165 @@
 """Configuration module for sync-icloud-git."""
-import argparse
+import functools
+import operator
 import os
+import sys
+from dataclasses import dataclass
 
+# Prefix shared by all environment variables read by SyncConfig
+ENV_PREFIX = "SYNC_ICLOUD_GIT__"
 
+# SyncConfig fields that can be set through SYNC_ICLOUD_GIT__<FIELD_NAME> environment variables
+_ENV_FIELDS = (
+    'git_remote_url',
+    'git_username',
+    'git_pat',
+    'git_repo_path',
+    'git_commit_message',
+    'git_commit_username',
+    'git_commit_email',
+    'rclone_config_content',
+    'rclone_remote_folder',
+    'rclone_remote_name',
+)
+
+# Pipeline steps selectable with --step
+_STEPS = ('all', 'clone', 'update', 'sync')
+_STEP_CHOICES = frozenset(_STEPS)
+
+# Required settings as (field name, label used in error messages), checked in this order
+_REQUIRED = (
+    ('git_remote_url', "Git remote URL"),
+    ('git_username', "Git username"),
+    ('git_pat', "Git Personal Access Token"),
+    ('rclone_config_content', "Rclone configuration content"),
+    ('rclone_remote_folder', "Rclone remote folder"),
+)
+_REQUIRED_GETTERS = tuple(operator.attrgetter(name) for name, _ in _REQUIRED)
+
+# Last load_config() result as (key, config), where key captures argv and the prefixed environment
+_CACHED = None
+
+# SYNC_ICLOUD_GIT__* environment variables, snapshotted on first use
+_ENV_SNAPSHOT = None
+
+
+def _env_snapshot():
+    """Return the SYNC_ICLOUD_GIT__* environment variables, reading os.environ only once.
+
+    Returns:
+        dict: Mapping of prefixed variable names to their values.
+    """
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        _ENV_SNAPSHOT = {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+    return _ENV_SNAPSHOT
+
+
+def _env_values():
+    """Return the configuration values set through environment variables.
+
+    Returns:
+        dict: Mapping of SyncConfig field names to their environment value (or None).
+    """
+    env = _env_snapshot()
+    return {name: env.get(ENV_PREFIX + name.upper()) for name in _ENV_FIELDS}
+
+
+def _extract_step(argv):
+    """Return the step if argv holds nothing but a valid --step option.
+
+    This covers the common invocation without building the argparse parser.
+
+    Args:
+        argv (list): Command line arguments without the program name.
+
+    Returns:
+        str: The requested step, or None if argv needs the full argparse parser.
+    """
+    if len(argv) == 1 and argv[0].startswith('--step='):
+        step = argv[0][len('--step='):]
+    elif len(argv) == 2 and argv[0] == '--step':
+        step = argv[1]
+    else:
+        return None
+    return step if step in _STEP_CHOICES else None
+
+
+# Command line options as (flags, add_argument keyword arguments). Environment variables and
+# defaults are applied after parsing, so none of these options carry a default of their own.
+_ARG_SPECS = (
+    (("-v", "--verbose"), dict(
+        action="store_true",
+        help="Enable verbose output for debugging and detailed information.",
+    )),
+    (("--step",), dict(
+        type=str,
+        choices=_STEPS,
+        default='all',
+        help="Which step(s) to execute: 'all' (default), 'clone' (clone repo only), 'update' (update existing repo only), or 'sync' (sync from iCloud only).",
+    )),
+    (("--exclude-patterns",), dict(
+        type=str,
+        nargs='*',
+        help="Additional patterns to exclude from iCloud sync (beyond defaults like .git, .DS_Store, etc.).",
+    )),
+    (("--git-remote-url",), dict(type=str, help="The repository URL to sync with iCloud.")),
+    (("--git-username",), dict(type=str, help="The Git username for authentication.")),
+    (("--git-pat",), dict(type=str, help="The Git Personal Access Token for authentication.")),
+    (("--git-repo-path",), dict(type=str, help="The local path where the git repository will be stored.")),
+    (("--git-commit-message",), dict(type=str, help="The commit message to use when committing changes.")),
+    (("--git-commit-username",), dict(type=str, help="The username to use for git commits (git user.name).")),
+    (("--git-commit-email",), dict(type=str, help="The email to use for git commits (git user.email).")),
+    (("--rclone-config-content",), dict(type=str, help="The rclone configuration content for iCloud access.")),
+    (("--rclone-remote-folder",), dict(type=str, help="The remote folder path in the cloud storage to sync with.")),
+    (("--rclone-remote-name",), dict(
+        type=str,
+        help="The rclone remote name from config (e.g., 'iclouddrive', 'nextcloud', 'gdrive'). Defaults to 'iclouddrive'.",
+    )),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the command line parser from _ARG_SPECS once per process.
+
+    Returns:
+        argparse.ArgumentParser: The command line parser.
+    """
+    # Imported here so that constructing SyncConfig directly never pays for argparse
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sync iCloud Git repository.")
+    for flags, kwargs in _ARG_SPECS:
+        parser.add_argument(*flags, **kwargs)
+    return parser
+
+
+@dataclass(slots=True, repr=False, eq=False)
 class SyncConfig:
     """Configuration for sync-icloud-git.
     
     This class serves as a Data Transfer Object (DTO) for configuration settings.
+    Unset (or empty) fields fall back to the DEFAULT_* class constants.
     """
     
     # Default git repository path within project directory
     DEFAULT_GIT_REPO_PATH = os.path.join(os.getcwd(), "synced_repo")
     
-    # Default git commit message
-    DEFAULT_GIT_COMMIT_MESSAGE = "Sync git with iCloud Drive"
+    # Default git commit message. The commit defaults are interned so equality checks can short-circuit on identity.
+    DEFAULT_GIT_COMMIT_MESSAGE = sys.intern("Sync git with iCloud Drive")
     
     # Default git commit author settings
-    DEFAULT_GIT_COMMIT_USERNAME = "Sync Bot"
-    DEFAULT_GIT_COMMIT_EMAIL = "sync-bot@example.com"
+    DEFAULT_GIT_COMMIT_USERNAME = sys.intern("Sync Bot")
+    DEFAULT_GIT_COMMIT_EMAIL = sys.intern("sync-bot@example.com")
 
     # Default rclone remote name (for backward compatibility with iCloud)
     DEFAULT_RCLONE_REMOTE_NAME = "iclouddrive"
 
     # Default patterns to exclude from cloud sync. Note, that these patterns are wrapped in single quotes
     # to ensure they are treated as strings later in the rclone command.
-    DEFAULT_EXCLUDE_PATTERNS = [
-        "'.git/'",       
+    DEFAULT_EXCLUDE_PATTERNS = (
+        "'.git/'",
         "'.git'",
         "'.git/**'",
         "'**/.git'",
@@ -36,170 +170,131 @@ class SyncConfig:
         "'**/.gitignore'",
         "'.gitlab-ci.yml'",
         "'**/.gitlab-ci.yml'",
-    ]
+    )
     
-    def __init__(self, git_remote_url=None, git_username=None, git_pat=None, git_repo_path=None, git_commit_message=None, git_commit_username=None, git_commit_email=None, rclone_config_content=None, rclone_remote_folder=None, rclone_remote_name=None, exclude_patterns=None, step=None, verbose=False):
-        """Initialize the SyncConfig object with provided or default values."""
-        self.git_remote_url = git_remote_url
-        self.git_username = git_username
-        self.git_pat = git_pat
-        self.git_repo_path = git_repo_path if git_repo_path else self.DEFAULT_GIT_REPO_PATH
-        self.git_commit_message = git_commit_message if git_commit_message else self.DEFAULT_GIT_COMMIT_MESSAGE
-        self.git_commit_username = git_commit_username if git_commit_username else self.DEFAULT_GIT_COMMIT_USERNAME
-        self.git_commit_email = git_commit_email if git_commit_email else self.DEFAULT_GIT_COMMIT_EMAIL
-        self.rclone_config_content = rclone_config_content
-        self.rclone_remote_folder = rclone_remote_folder
-        self.rclone_remote_name = rclone_remote_name if rclone_remote_name else self.DEFAULT_RCLONE_REMOTE_NAME
-        self.exclude_patterns = exclude_patterns if exclude_patterns else self.DEFAULT_EXCLUDE_PATTERNS.copy()
-        self.step = step if step else 'all'
-        self.verbose = verbose
+    git_remote_url: str | None = None
+    git_username: str | None = None
+    git_pat: str | None = None
+    git_repo_path: str | None = None
+    git_commit_message: str | None = None
+    git_commit_username: str | None = None
+    git_commit_email: str | None = None
+    rclone_config_content: str | None = None
+    rclone_remote_folder: str | None = None
+    rclone_remote_name: str | None = None
+    exclude_patterns: list[str] | None = None
+    step: str | None = None
+    verbose: bool = False
+
+    def __post_init__(self):
+        """Replace unset values with their defaults and check the step.
+
+        Raises:
+            ValueError: If step is not one of the known pipeline steps.
+        """
+        self.git_repo_path = self.git_repo_path if self.git_repo_path else self.DEFAULT_GIT_REPO_PATH
+        self.git_commit_message = self.git_commit_message if self.git_commit_message else self.DEFAULT_GIT_COMMIT_MESSAGE
+        self.git_commit_username = self.git_commit_username if self.git_commit_username else self.DEFAULT_GIT_COMMIT_USERNAME
+        self.git_commit_email = self.git_commit_email if self.git_commit_email else self.DEFAULT_GIT_COMMIT_EMAIL
+        self.rclone_remote_name = self.rclone_remote_name if self.rclone_remote_name else self.DEFAULT_RCLONE_REMOTE_NAME
+        self.exclude_patterns = self.exclude_patterns if self.exclude_patterns else list(self.DEFAULT_EXCLUDE_PATTERNS)
+        self.step = self.step if self.step else 'all'
+        if self.step not in _STEP_CHOICES:
+            raise ValueError(f"Invalid step '{self.step}'. Choose from: {', '.join(_STEPS)}.")
     
     @classmethod
     def load_config(cls):
         """Load configuration from command line arguments, environment variables, or defaults.
         
+        SYNC_ICLOUD_GIT__* environment variables are read once per process. The
+        result is cached and reused as long as the command line arguments are unchanged.
+
         Returns:
             SyncConfig: A configuration object.
         """
-        # Check environment variables first
-        env_remote_url = os.environ.get("SYNC_ICLOUD_GIT__GIT_REMOTE_URL")
-        env_username = os.environ.get("SYNC_ICLOUD_GIT__GIT_USERNAME")
-        env_pat = os.environ.get("SYNC_ICLOUD_GIT__GIT_PAT")
-        env_repo_path = os.environ.get("SYNC_ICLOUD_GIT__GIT_REPO_PATH")
-        env_commit_message = os.environ.get("SYNC_ICLOUD_GIT__GIT_COMMIT_MESSAGE")
-        env_commit_username = os.environ.get("SYNC_ICLOUD_GIT__GIT_COMMIT_USERNAME")
-        env_commit_email = os.environ.get("SYNC_ICLOUD_GIT__GIT_COMMIT_EMAIL")
-        env_rclone_config = os.environ.get("SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT")
-        env_rclone_remote_folder = os.environ.get("SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER")
-        env_rclone_remote_name = os.environ.get("SYNC_ICLOUD_GIT__RCLONE_REMOTE_NAME")
-        
-        parser = argparse.ArgumentParser(description="Sync iCloud Git repository.")
-        parser.add_argument(
-            "-v", "--verbose",
-            action="store_true",
-            help="Enable verbose output for debugging and detailed information."
-        )
-        parser.add_argument(
-            "--step",
-            type=str,
-            choices=['all', 'clone', 'update', 'sync'],
-            default='all',
-            help="Which step(s) to execute: 'all' (default), 'clone' (clone repo only), 'update' (update existing repo only), or 'sync' (sync from iCloud only)."
-        )
-        parser.add_argument(
-            "--exclude-patterns",
-            type=str,
-            nargs='*',
-            help="Additional patterns to exclude from iCloud sync (beyond defaults like .git, .DS_Store, etc.)."
-        )
-        parser.add_argument(
-            "--git-remote-url",
-            type=str,
-            help="The repository URL to sync with iCloud.",
-            required=not bool(env_remote_url),  # Only required if not in environment
-            default=env_remote_url,
-        )
-        parser.add_argument(
-            "--git-username",
-            type=str,
-            help="The Git username for authentication.",
-            required=not bool(env_username),  # Only required if not in environment
-            default=env_username,
-        )
-        parser.add_argument(
-            "--git-pat",
-            type=str,
-            help="The Git Personal Access Token for authentication.",
-            required=not bool(env_pat),  # Only required if not in environment
-            default=env_pat,
-        )
-        parser.add_argument(
-            "--git-repo-path",
-            type=str,
-            help="The local path where the git repository will be stored.",
-            required=False,
-            default=env_repo_path if env_repo_path else cls.DEFAULT_GIT_REPO_PATH,
-        )
-        parser.add_argument(
-            "--git-commit-message",
-            type=str,
-            help="The commit message to use when committing changes.",
-            required=False,
-            default=env_commit_message if env_commit_message else cls.DEFAULT_GIT_COMMIT_MESSAGE,
-        )
-        parser.add_argument(
-            "--git-commit-username",
-            type=str,
-            help="The username to use for git commits (git user.name).",
-            required=False,
-            default=env_commit_username if env_commit_username else cls.DEFAULT_GIT_COMMIT_USERNAME,
-        )
-        parser.add_argument(
-            "--git-commit-email",
-            type=str,
-            help="The email to use for git commits (git user.email).",
-            required=False,
-            default=env_commit_email if env_commit_email else cls.DEFAULT_GIT_COMMIT_EMAIL,
-        )
-        parser.add_argument(
-            "--rclone-config-content",
-            type=str,
-            help="The rclone configuration content for iCloud access.",
-            required=not bool(env_rclone_config),  # Only required if not in environment
-            default=env_rclone_config,
-        )
-        parser.add_argument(
-            "--rclone-remote-folder",
-            type=str,
-            help="The remote folder path in the cloud storage to sync with.",
-            required=not bool(env_rclone_remote_folder),  # Only required if not in environment
-            default=env_rclone_remote_folder,
-        )
-        parser.add_argument(
-            "--rclone-remote-name",
-            type=str,
-            help="The rclone remote name from config (e.g., 'iclouddrive', 'nextcloud', 'gdrive'). Defaults to 'iclouddrive'.",
-            required=False,
-            default=env_rclone_remote_name if env_rclone_remote_name else cls.DEFAULT_RCLONE_REMOTE_NAME,
-        )
+        global _CACHED
+        env = _env_snapshot()
+        key = (tuple(sys.argv), tuple(sorted(env.items())))
+        if _CACHED is not None and _CACHED[0] == key:
+            return _CACHED[1]
+
+        argv = sys.argv[1:]
+        step = _extract_step(argv) if argv else 'all'
+        if step is None:
+            config = cls._from_command_line()
+        else:
+            # Without options other than --step there is nothing argparse needs to do
+            try:
+                config = cls.from_env()
+            except ValueError as e:
+                _get_parser().error(str(e))
+            config.step = step
+        _CACHED = (key, config)
+        return config
+
+    @classmethod
+    def from_env(cls):
+        """Load configuration from SYNC_ICLOUD_GIT__* environment variables and defaults only.
+
+        Returns:
+            SyncConfig: A configuration object.
+
+        Raises:
+            ValueError: If a required setting is missing.
+        """
+        config = cls(**_env_values())
+        config._validate()
+        return config
+
+    @classmethod
+    def _from_command_line(cls):
+        """Load configuration from command line arguments, falling back to environment variables.
+
+        Returns:
+            SyncConfig: A configuration object.
+        """
+        env_values = _env_values()
+        parser = _get_parser()
         args = parser.parse_args()
-        
-        # Validate required arguments
-        if not args.git_remote_url:
-            parser.error("Git remote URL is required. Provide it with --git-remote-url or set SYNC_ICLOUD_GIT__GIT_REMOTE_URL environment variable.")
-        
-        if not args.git_username:
-            parser.error("Git username is required. Provide it with --git-username or set SYNC_ICLOUD_GIT__GIT_USERNAME environment variable.")
-        
-        if not args.git_pat:
-            parser.error("Git Personal Access Token is required. Provide it with --git-pat or set SYNC_ICLOUD_GIT__GIT_PAT environment variable.")
-        
-        if not args.rclone_config_content:
-            parser.error("Rclone configuration content is required. Provide it with --rclone-config-content or set SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT environment variable.")
-        
-        if not args.rclone_remote_folder:
-            parser.error("Rclone remote folder is required. Provide it with --rclone-remote-folder or set SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER environment variable.")
-        
+
+        # Command line arguments take precedence over environment variables
+        values = {name: getattr(args, name) or env_values[name] for name in _ENV_FIELDS}
+
         # Handle exclude patterns (combine defaults with any additional ones)
-        exclude_patterns = cls.DEFAULT_EXCLUDE_PATTERNS.copy()
-        if args.exclude_patterns:
-            exclude_patterns.extend(args.exclude_patterns)
-            
-        return cls(
-            git_remote_url=args.git_remote_url,
-            git_username=args.git_username,
-            git_pat=args.git_pat,
-            git_repo_path=args.git_repo_path,
-            git_commit_message=args.git_commit_message,
-            git_commit_username=args.git_commit_username,
-            git_commit_email=args.git_commit_email,
-            rclone_config_content=args.rclone_config_content,
-            rclone_remote_folder=args.rclone_remote_folder,
-            rclone_remote_name=args.rclone_remote_name,
-            exclude_patterns=exclude_patterns,
-            step=args.step,
-            verbose=args.verbose
-        )
+        exclude_patterns = [*cls.DEFAULT_EXCLUDE_PATTERNS, *(args.exclude_patterns or ())]
+
+        config = cls(**values, exclude_patterns=exclude_patterns, step=args.step, verbose=args.verbose)
+        try:
+            config._validate()
+        except ValueError as e:
+            parser.error(str(e))
+        return config
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget the configuration cached by load_config()."""
+        global _CACHED
+        _CACHED = None
+
+    @staticmethod
+    def _refresh_env_snapshot():
+        """Force the next load_config() to re-read SYNC_ICLOUD_GIT__* environment variables."""
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = None
+    
+    def _validate(self):
+        """Check that all required settings are present.
+
+        Raises:
+            ValueError: If any required setting is missing; the message names all of them.
+        """
+        missing = [
+            f"{label} (--{name.replace('_', '-')} or {ENV_PREFIX}{name.upper()})"
+            for (name, label), getter in zip(_REQUIRED, _REQUIRED_GETTERS)
+            if not getter(self)
+        ]
+        if missing:
+            raise ValueError(f"Missing required settings: {', '.join(missing)}")
     
     def __repr__(self):
         """Return a string representation of the configuration.
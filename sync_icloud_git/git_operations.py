@@ -1,7 +1,11 @@
 """Git operations module for sync-icloud-git."""
+import logging
 import os
+
 import git
 
+logger = logging.getLogger(__name__)
+
 
 class GitOperations:
     """Class for handling Git operations with authentication support."""
@@ -16,7 +20,7 @@ class GitOperations:
         self.repo = None
         
         if self.git_username and self.git_pat and config.verbose:
-            print(f"Git authentication configured for user: {self.git_username}")
+            logger.info("Git authentication configured for user: %s", self.git_username)
 
 
     def load_existing_repo(self):
@@ -25,13 +29,13 @@ class GitOperations:
             return False
         
         try:
-            print(f"Loading existing git repository at {self.git_repo_path}")
+            logger.info("Loading existing git repository at %s", self.git_repo_path)
             self.repo = git.Repo(self.git_repo_path)
             # Configure git identity for commits
             self._configure_git_identity(self.repo)
             return True
         except Exception as e:
-            print(f"Error loading repository: {e}")
+            logger.error("Error loading repository: %s", e)
             return False
 
 
@@ -42,7 +46,7 @@ class GitOperations:
             return False
         
         try:
-            print(f"Found existing git repository at {self.git_repo_path}")
+            logger.info("Found existing git repository at %s", self.git_repo_path)
             self.repo = git.Repo(self.git_repo_path)
             
             # Configure git identity for commits
@@ -61,18 +65,18 @@ class GitOperations:
             if self.git_username and self.git_pat:
                 self.repo.remotes.origin.set_url(self._get_auth_url())
             
-            print("Fetching and pulling latest changes...")
+            logger.info("Fetching and pulling latest changes...")
             self.repo.remotes.origin.fetch()
             self.repo.remotes.origin.pull(self.repo.active_branch.name)
 
             # Update submodules
             self._setup_submodules()
 
-            print("Repository and submodules updated successfully!")
+            logger.info("Repository and submodules updated successfully!")
             return True
             
         except Exception as e:
-            print(f"Error updating repository: {e}")
+            logger.error("Error updating repository: %s", e)
             raise
 
 
@@ -80,7 +84,7 @@ class GitOperations:
         """Clone repository with submodules."""
         try:
             os.makedirs(os.path.dirname(self.git_repo_path), exist_ok=True)
-            print(f"Cloning repository from {self.git_remote_url} to {self.git_repo_path}")
+            logger.info("Cloning repository from %s to %s", self.git_remote_url, self.git_repo_path)
             
             # Clone main repository
             self.repo = git.Repo.clone_from(self._get_auth_url(), self.git_repo_path, recursive=False)
@@ -91,11 +95,11 @@ class GitOperations:
             # Setup submodules
             self._setup_submodules()
 
-            print("Repository cloned successfully!")
+            logger.info("Repository cloned successfully!")
             return True
             
         except Exception as e:
-            print(f"Error cloning repository: {e}")
+            logger.error("Error cloning repository: %s", e)
             return False
 
 
@@ -115,9 +119,9 @@ class GitOperations:
             repo.git.config('user.email', self.config.git_commit_email)
             
             if self.config.verbose:
-                print(f"Git identity configured: {self.config.git_commit_username} <{self.config.git_commit_email}>")
+                logger.info("Git identity configured: %s <%s>", self.config.git_commit_username, self.config.git_commit_email)
         except Exception as e:
-            print(f"Warning: Could not configure git identity: {e}")
+            logger.warning("Could not configure git identity: %s", e)
             # Don't fail the operation, just warn
 
 
@@ -126,7 +130,7 @@ class GitOperations:
         if not self.repo.submodules:
             return
 
-        print(f"Found {len(self.repo.submodules)} submodules, updating to latest...")
+        logger.info("Found %s submodules, updating to latest...", len(self.repo.submodules))
 
         # Configure auth and update submodules in one go
         for submodule in self.repo.submodules:
@@ -145,7 +149,7 @@ class GitOperations:
                     submodule_repo.git.checkout(branch)
                     # Configure git identity for submodule commits
                     self._configure_git_identity(submodule_repo)
-                    print(f"Updated submodule '{submodule.name}' on '{branch}'")
+                    logger.info("Updated submodule '%s' on '%s'", submodule.name, branch)
                     break
                 except:
                     continue
@@ -154,7 +158,7 @@ class GitOperations:
     def commit_changes(self):
         """Commit all changes in the main repository and submodules."""
         if not self.repo:
-            print("No repository loaded. Cannot commit changes.")
+            logger.error("No repository loaded. Cannot commit changes.")
             return False
         
         try:
@@ -168,7 +172,7 @@ class GitOperations:
                     
                     # Check if there are changes to commit in the submodule
                     if submodule_repo.is_dirty(untracked_files=True):
-                        print(f"Committing changes in submodule: {submodule.name}")
+                        logger.info("Committing changes in submodule: %s", submodule.name)
                         
                         # Add all changes (including untracked files)
                         submodule_repo.git.add('-A')
@@ -177,17 +181,17 @@ class GitOperations:
                         submodule_repo.index.commit(commit_message)
                         committed_repos.append(f"submodule '{submodule.name}'")
                         
-                        print(f"Successfully committed changes in submodule: {submodule.name}")
+                        logger.info("Successfully committed changes in submodule: %s", submodule.name)
                     else:
-                        print(f"No changes to commit in submodule: {submodule.name}")
+                        logger.info("No changes to commit in submodule: %s", submodule.name)
                         
                 except Exception as e:
-                    print(f"Error committing changes in submodule {submodule.name}: {e}")
+                    logger.error("Error committing changes in submodule %s: %s", submodule.name, e)
                     continue
             
             # Then, commit changes in the main repository (including submodule updates)
             if self.repo.is_dirty(untracked_files=True):
-                print("Committing changes in main repository...")
+                logger.info("Committing changes in main repository...")
                 
                 # Add all changes (including untracked files and submodule updates)
                 self.repo.git.add('-A')
@@ -196,27 +200,27 @@ class GitOperations:
                 self.repo.index.commit(commit_message)
                 committed_repos.append("main repository")
                 
-                print("Successfully committed changes in main repository")
+                logger.info("Successfully committed changes in main repository")
             else:
-                print("No changes to commit in main repository")
+                logger.info("No changes to commit in main repository")
             
             if committed_repos:
-                print(f"Changes committed successfully in: {', '.join(committed_repos)}")
-                print(f"Commit message used: '{commit_message}'")
+                logger.info("Changes committed successfully in: %s", ', '.join(committed_repos))
+                logger.info("Commit message used: '%s'", commit_message)
                 return True
             else:
-                print("No changes found to commit in any repository")
+                logger.info("No changes found to commit in any repository")
                 return False
                 
         except Exception as e:
-            print(f"Error committing changes: {e}")
+            logger.error("Error committing changes: %s", e)
             return False
 
 
     def push_changes(self):
         """Push committed changes to remote repositories."""
         if not self.repo:
-            print("No repository loaded. Cannot push changes.")
+            logger.error("No repository loaded. Cannot push changes.")
             return False
         
         try:
@@ -229,43 +233,43 @@ class GitOperations:
                     
                     # Check if there are commits to push
                     if list(submodule_repo.iter_commits('HEAD@{u}..HEAD')):
-                        print(f"Pushing changes in submodule: {submodule.name}")
+                        logger.info("Pushing changes in submodule: %s", submodule.name)
                         
                         # Push to the remote
                         origin = submodule_repo.remote('origin')
                         origin.push()
                         pushed_repos.append(f"submodule '{submodule.name}'")
                         
-                        print(f"Successfully pushed changes in submodule: {submodule.name}")
+                        logger.info("Successfully pushed changes in submodule: %s", submodule.name)
                     else:
-                        print(f"No commits to push in submodule: {submodule.name}")
+                        logger.info("No commits to push in submodule: %s", submodule.name)
                         
                 except Exception as e:
-                    print(f"Error pushing changes in submodule {submodule.name}: {e}")
+                    logger.error("Error pushing changes in submodule %s: %s", submodule.name, e)
                     continue
             
             # Then, push changes in the main repository
             if list(self.repo.iter_commits('HEAD@{u}..HEAD')):
-                print("Pushing changes in main repository...")
+                logger.info("Pushing changes in main repository...")
                 
                 # Push to the remote
                 origin = self.repo.remote('origin')
                 origin.push()
                 pushed_repos.append("main repository")
                 
-                print("Successfully pushed changes in main repository")
+                logger.info("Successfully pushed changes in main repository")
             else:
-                print("No commits to push in main repository")
+                logger.info("No commits to push in main repository")
             
             if pushed_repos:
-                print(f"Changes pushed successfully to: {', '.join(pushed_repos)}")
+                logger.info("Changes pushed successfully to: %s", ', '.join(pushed_repos))
                 return True
             else:
-                print("No changes found to push in any repository")
+                logger.info("No changes found to push in any repository")
                 return False
                 
         except Exception as e:
-            print(f"Error pushing changes: {e}")
+            logger.error("Error pushing changes: %s", e)
             return False
 
 
@@ -275,30 +279,30 @@ class GitOperations:
             # Use git status --porcelain for clean, parseable output
             status_output = repo.git.status('--porcelain')
             if status_output.strip():
-                print(status_output)
+                logger.info("%s", status_output)
             else:
-                print("  (no changes)")
+                logger.info("  (no changes)")
         except Exception as e:
-            print(f"  Error getting status: {e}")
+            logger.error("  Error getting status: %s", e)
 
     def show_changed_files(self):
         """Show files that have changed since the last commit in main repo and submodules."""
         if not self.repo:
-            print("No repository loaded.")
+            logger.error("No repository loaded.")
             return False
         
         # Main repository
-        print(f"Main repository ({self.git_repo_path}):")
+        logger.info("Main repository (%s):", self.git_repo_path)
         self._print_repo_changes(self.repo)
         
         # Submodules
         for submodule in self.repo.submodules:
             try:
                 submodule_repo = submodule.module()
-                print(f"Submodule '{submodule.name}':")
+                logger.info("Submodule '%s':", submodule.name)
                 self._print_repo_changes(submodule_repo)
             except Exception as e:
-                print(f"Submodule '{submodule.name}': Error - {e}")
+                logger.error("Submodule '%s': Error - %s", submodule.name, e)
         
         return True
 
@@ -0,0 +1,40 @@
+"""Shared pytest fixtures for sync-icloud-git tests."""
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+def pytest_addoption(parser):
+    """Add the --run-integration option."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Also run tests marked as integration (skipped by default).",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --run-integration was given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration test, use --run-integration to run it")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def mock_rclone():
+    """Replace rclone_python's rclone module once for the whole session.
+
+    cloud_operations imports it inside the methods that call rclone, so the stub is
+    set as an attribute of the rclone_python package. It is specced from the real
+    module, so calling a function rclone_python does not provide fails instead of
+    passing silently. Tests that need a clean stub should reset it rather than
+    re-patching.
+    """
+    from rclone_python import rclone
+
+    with patch('rclone_python.rclone', MagicMock(spec=rclone)) as rclone_stub:
+        yield rclone_stub
+
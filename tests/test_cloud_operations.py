@@ -1,110 +1,161 @@
 """Tests for cloud_operations.py module."""
+import copy
+import dataclasses
+import io
+import logging
 import os
 import pytest
 import tempfile
-from unittest.mock import Mock, patch, MagicMock, call, mock_open
+from unittest.mock import Mock, patch, MagicMock, call
 from sync_icloud_git.cloud_operations import CloudSyncOperations, ICloudOperations
 from sync_icloud_git.config import SyncConfig
 
+# Mock of the temporary rclone config file, built once and reset by the mock_rclone_config_file fixture.
+# A shallow copy would share its write/flush/close children, so the one instance is reused instead.
+_PROTO_CONFIG_FILE = Mock(spec=io.TextIOWrapper)
+
+
+def _derive(config, **changes):
+    """Copy config with changes applied, giving the copy its own exclude pattern list."""
+    changes.setdefault('exclude_patterns', list(config.exclude_patterns))
+    return dataclasses.replace(config, **changes)
+
+
+@pytest.fixture(autouse=True)
+def reset_rclone_stub(mock_rclone):
+    """Reset the session-wide rclone stub so no state leaks between tests."""
+    mock_rclone.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope='module')
+def sample_config(tmp_path_factory):
+    """Create a sample configuration, shared by every test in the module."""
+    return SyncConfig(
+        git_remote_url="https://github.com/test/repo.git",
+        git_username="testuser",
+        git_pat="test_token",
+        git_repo_path=str(tmp_path_factory.mktemp("test_repo")),
+        git_commit_message="Test commit message",
+        rclone_config_content="[iclouddrive]\ntype = webdav\nurl = https://p123-caldav.icloud.com\nuser = testuser\npass = testpass",
+        rclone_remote_folder="Documents/TestFolder",
+        exclude_patterns=[".DS_Store", "*.tmp"],
+        step="all"
+    )
+
+
+@pytest.fixture(scope='module')
+def verbose_config(sample_config):
+    """The sample configuration with verbose output enabled."""
+    return _derive(sample_config, verbose=True)
+
+
+@pytest.fixture(scope='module')
+def _prototype_icloud_ops(sample_config, tmp_path_factory):
+    """Construct one CloudSyncOperations for the module; tests work on shallow copies of it."""
+    mock_file = Mock()
+    mock_file.name = str(tmp_path_factory.mktemp("rclone") / "rclone.conf")
+    with patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile', return_value=mock_file):
+        ops = CloudSyncOperations(sample_config)
+    yield ops
+    ops.close()
+
+
+@pytest.fixture(scope='module')
+def shared_icloud_ops(_prototype_icloud_ops):
+    """The prototype instance itself, for tests that only read from it and must not change it."""
+    return _prototype_icloud_ops
+
 
 class TestCloudOperations:
     """Test cases for CloudSyncOperations class."""
 
-    @pytest.fixture
-    def sample_config(self):
-        """Create a sample configuration for testing."""
-        return SyncConfig(
-            git_remote_url="https://github.com/test/repo.git",
-            git_username="testuser",
-            git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
-            git_commit_message="Test commit message",
-            rclone_config_content="[iclouddrive]\ntype = webdav\nurl = https://p123-caldav.icloud.com\nuser = testuser\npass = testpass",
-            rclone_remote_folder="Documents/TestFolder",
-            exclude_patterns=[".DS_Store", "*.tmp"],
-            step="all"
-        )
+    @pytest.fixture(autouse=True)
+    def capture_cloud_logs(self, caplog):
+        """Record the INFO messages CloudSyncOperations logs while a test runs."""
+        caplog.set_level(logging.INFO, logger="sync_icloud_git.cloud_operations")
 
     @pytest.fixture
-    def mock_rclone_config_file(self):
-        """Create a mock NamedTemporaryFile for rclone config."""
-        mock_file = Mock()
-        mock_file.name = "/tmp/test_rclone_config.conf"
-        mock_file.write = Mock()
-        mock_file.flush = Mock()
-        mock_file.close = Mock()
+    def mock_rclone_config_file(self, tmp_path):
+        """Provide the mock NamedTemporaryFile for rclone config, cleared and pointed at this test's tmp_path."""
+        mock_file = _PROTO_CONFIG_FILE
+        mock_file.reset_mock()
+        mock_file.name = str(tmp_path / "rclone.conf")
         return mock_file
 
     @pytest.fixture
-    def mock_rclone_module(self):
-        """Create a mock rclone module."""
-        mock_rclone = Mock()
-        mock_rclone.ls.return_value = ["file1.txt", "file2.txt", "subfolder/file3.txt"]
-        mock_rclone.sync.return_value = None
-        return mock_rclone
+    def icloud_ops(self, _prototype_icloud_ops, mock_rclone_config_file):
+        """Copy of the prototype instance wired to this test's config file mock."""
+        ops = copy.copy(_prototype_icloud_ops)
+        ops.rclone_config_file = mock_rclone_config_file
+        yield ops
+        # Detach the mock so a late __del__ (e.g. via a kept traceback) cleans up nothing
+        ops.rclone_config_file = None
+
+    @pytest.fixture
+    def mock_tempfile(self, monkeypatch, mock_rclone_config_file):
+        """Replace tempfile.NamedTemporaryFile so it hands out the config file mock."""
+        mock_tempfile = Mock(return_value=mock_rclone_config_file)
+        monkeypatch.setattr('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile', mock_tempfile)
+        return mock_tempfile
+
+    @pytest.fixture
+    def mock_makedirs(self, monkeypatch):
+        """Replace os.makedirs as seen by cloud_operations."""
+        mock_makedirs = Mock()
+        monkeypatch.setattr('sync_icloud_git.cloud_operations.os.makedirs', mock_makedirs)
+        return mock_makedirs
+
+    @pytest.fixture
+    def mock_exists(self, monkeypatch):
+        """Replace os.path.exists as seen by cloud_operations."""
+        mock_exists = Mock()
+        monkeypatch.setattr('sync_icloud_git.cloud_operations.os.path.exists', mock_exists)
+        return mock_exists
+
+    @pytest.fixture
+    def mock_unlink(self, monkeypatch):
+        """Replace os.unlink as seen by cloud_operations."""
+        mock_unlink = Mock()
+        monkeypatch.setattr('sync_icloud_git.cloud_operations.os.unlink', mock_unlink)
+        return mock_unlink
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_init_success(self, mock_open_builtin, mock_tempfile, mock_rclone_config_file, capsys):
+    def test_init_success(self, mock_tempfile, mock_rclone_config_file, verbose_config, caplog):
         """Test successful ICloudOperations initialization."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        # Create a verbose config to see initialization messages
-        verbose_config = SyncConfig(
-            git_remote_url="https://github.com/test/repo.git",
-            git_username="testuser",
-            git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
-            git_commit_message="Test commit message",
-            rclone_config_content="[iclouddrive]\ntype = webdav\nurl = https://p123-caldav.icloud.com\nuser = testuser\npass = testpass",
-            rclone_remote_folder="Documents/TestFolder",
-            exclude_patterns=[".DS_Store", "*.tmp"],
-            step="all",
-            verbose=True
-        )
-        
-        icloud_ops = CloudSyncOperations(verbose_config)
-        
-        # Verify initialization
-        assert icloud_ops.config == verbose_config
-        assert icloud_ops.git_repo_path == verbose_config.git_repo_path
-        assert icloud_ops.rclone_config_content == verbose_config.rclone_config_content
-        assert icloud_ops.rclone_remote_folder == verbose_config.rclone_remote_folder
-        assert icloud_ops.rclone_config_file == mock_rclone_config_file
-        
-        # Verify config file setup
-        mock_tempfile.assert_called_once_with(mode='w', suffix='.conf', delete=False)
-        mock_rclone_config_file.write.assert_called_once_with(verbose_config.rclone_config_content)
-        mock_rclone_config_file.flush.assert_called_once()
-        mock_rclone_config_file.close.assert_called_once()
-        
-        # Verify config file verification
-        mock_open_builtin.assert_called_with(mock_rclone_config_file.name, 'r', encoding='utf-8')
-        
-        # Check output messages
-        captured = capsys.readouterr()
-        assert f"Cloud sync configured: {verbose_config.rclone_remote_name}:{verbose_config.rclone_remote_folder} → test_repo" in captured.out
-        assert f"Rclone config ready" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="")
-    def test_init_empty_config_file(self, mock_open_builtin, mock_tempfile, sample_config, mock_rclone_config_file):
-        """Test initialization with empty config file raises error."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        with pytest.raises(ValueError, match="Rclone config file is empty after write"):
-            CloudSyncOperations(sample_config)
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_test_icloud_connection_success(self, mock_rclone, mock_open_builtin, mock_tempfile, 
-                                           sample_config, mock_rclone_config_file, capsys):
+        # Use a verbose config to see initialization messages
+        with CloudSyncOperations(verbose_config) as icloud_ops:
+            # Verify initialization
+            assert icloud_ops.config == verbose_config
+            assert icloud_ops.git_repo_path == verbose_config.git_repo_path
+            assert icloud_ops.rclone_config_content == verbose_config.rclone_config_content
+            assert icloud_ops.rclone_remote_folder == verbose_config.rclone_remote_folder
+            assert icloud_ops.rclone_config_file == mock_rclone_config_file
+            
+            # Verify config file setup
+            mock_tempfile.assert_called_once_with(mode='w', suffix='.conf', delete=False)
+            assert mock_rclone_config_file.method_calls == [
+                call.write(verbose_config.rclone_config_content),
+                call.flush(),
+                call.close(),
+            ]
+            
+            # Check output messages
+            assert f"Cloud sync configured: {verbose_config.rclone_remote_name}:{verbose_config.rclone_remote_folder} → {os.path.basename(verbose_config.git_repo_path)}" in caplog.text
+            assert f"Rclone config ready" in caplog.text
+
+    @pytest.mark.parametrize("content", ["", "  \n"], ids=["empty", "whitespace"])
+    def test_init_empty_config_content(self, mock_tempfile, sample_config, content):
+        """Test initialization with empty config content raises error before any file is created."""
+        empty_config = _derive(sample_config, rclone_config_content=content)
+
+        with pytest.raises(ValueError, match="Rclone config content is empty"):
+            CloudSyncOperations(empty_config)
+
+        mock_tempfile.assert_not_called()
+
+    def test_test_icloud_connection_success(self, icloud_ops, mock_rclone, sample_config, mock_rclone_config_file, caplog):
         """Test successful iCloud connection test."""
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.ls.return_value = ["file1.txt", "file2.txt", "folder/file3.txt"]
         
-        icloud_ops = CloudSyncOperations(sample_config)
         result = icloud_ops.test_icloud_connection()
         
         assert result == 3
@@ -117,259 +168,131 @@ class TestCloudOperations:
         )
         
         # Check output
-        captured = capsys.readouterr()
-        assert "Testing cloud storage connection..." in captured.out
-        assert "✅ Found 3 items in remote folder" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_test_icloud_connection_failure(self, mock_rclone, mock_open_builtin, mock_tempfile,
-                                           sample_config, mock_rclone_config_file, capsys):
+        assert "Testing cloud storage connection..." in caplog.text
+        assert "✅ Found 3 items in remote folder" in caplog.text
+
+    def test_test_icloud_connection_failure(self, icloud_ops, mock_rclone, caplog):
         """Test iCloud connection test failure."""
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.ls.side_effect = RuntimeError("Connection failed")
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        
+
         with pytest.raises(RuntimeError, match="Connection failed"):
             icloud_ops.test_icloud_connection()
         
         # Check error output
-        captured = capsys.readouterr()
-        assert "❌ Failed to connect to remote folder" in captured.out
+        assert "❌ Failed to connect to remote folder" in caplog.text
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_build_remote_path(self, mock_open_builtin, mock_tempfile, sample_config, mock_rclone_config_file):
+    def test_build_remote_path(self, shared_icloud_ops, sample_config):
         """Test remote path building."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        remote_path = icloud_ops._build_remote_path()
+        remote_path = shared_icloud_ops._build_remote_path()
         
         expected = f"iclouddrive:{sample_config.rclone_remote_folder}"
         assert remote_path == expected
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.makedirs')
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_sync_from_icloud_to_repo_success(self, mock_rclone, mock_makedirs, mock_open_builtin, 
-                                            mock_tempfile, sample_config, mock_rclone_config_file, capsys):
-        """Test successful sync from iCloud to repository."""
-        mock_tempfile.return_value = mock_rclone_config_file
+    @pytest.mark.parametrize("sync_side_effect, expected_error, expected_messages", [
+        (None, None, ("✅ rclone sync completed!", "files in repository")),
+        (Exception("Sync failed"), "Sync operation failed: Sync failed", ("❌ rclone sync failed: Sync failed",)),
+    ], ids=["success", "failure"])
+    def test_sync_from_icloud_to_repo(self, mock_makedirs, icloud_ops, mock_rclone, sample_config, monkeypatch, caplog,
+                                      sync_side_effect, expected_error, expected_messages):
+        """Test sync from iCloud to repository, including RCLONE_CONFIG being restored either way."""
+        monkeypatch.setenv('RCLONE_CONFIG', 'old_config_path')
         mock_rclone.ls.return_value = ["file1.txt", "file2.txt"]
-        mock_rclone.sync.return_value = None
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        icloud_ops.sync_from_icloud_to_repo()
-        
+        mock_rclone.sync.side_effect = sync_side_effect
+
+        if expected_error is None:
+            icloud_ops.sync_from_icloud_to_repo()
+        else:
+            with pytest.raises(RuntimeError, match=expected_error):
+                icloud_ops.sync_from_icloud_to_repo()
+
         # Verify directory creation
         mock_makedirs.assert_called_once_with(sample_config.git_repo_path, exist_ok=True)
-        
+
         # Verify rclone operations
         expected_remote_path = f"iclouddrive:{sample_config.rclone_remote_folder}"
-        mock_rclone.ls.assert_called_once()
-        mock_rclone.sync.assert_called_once()
-        
+        assert [c[0] for c in mock_rclone.method_calls] == ['ls', 'sync']
+
         # Verify sync call arguments
         sync_call_args = mock_rclone.sync.call_args
         assert sync_call_args[1]['src_path'] == expected_remote_path
         assert sync_call_args[1]['dest_path'] == sample_config.git_repo_path
         assert sync_call_args[1]['show_progress'] is True
-        
-        # Verify exclude patterns in args
-        args = sync_call_args[1]['args']
-        assert '--exclude' in args
-        assert '.DS_Store' in args
-        assert '*.tmp' in args
-        
-        # Check output
-        captured = capsys.readouterr()
-        assert "Starting sync from remote folder" in captured.out
-        assert "✅ rclone sync completed!" in captured.out
-        assert "files in repository" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.makedirs')
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_sync_from_icloud_to_repo_failure(self, mock_rclone, mock_makedirs, mock_open_builtin,
-                                             mock_tempfile, sample_config, mock_rclone_config_file, capsys):
-        """Test sync failure handling."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.ls.return_value = ["file1.txt"]
-        mock_rclone.sync.side_effect = Exception("Sync failed")
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        
-        with pytest.raises(RuntimeError, match="Sync operation failed: Sync failed"):
-            icloud_ops.sync_from_icloud_to_repo()
-        
-        # Check error output
-        captured = capsys.readouterr()
-        assert "❌ rclone sync failed: Sync failed" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.makedirs')
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    @patch.dict('os.environ', {'RCLONE_CONFIG': 'old_config_path'})
-    def test_sync_environment_variable_handling(self, mock_rclone, mock_makedirs, mock_open_builtin,
-                                               mock_tempfile, sample_config, mock_rclone_config_file):
-        """Test proper handling of RCLONE_CONFIG environment variable."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.ls.return_value = ["file1.txt"]
-        mock_rclone.sync.return_value = None
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        
-        # Store original env var value
-        original_config = os.environ.get('RCLONE_CONFIG')
-        
-        icloud_ops.sync_from_icloud_to_repo()
-        
+
         # Verify environment variable was restored
-        assert os.environ.get('RCLONE_CONFIG') == original_config
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.makedirs')
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_execute_sync_operation_with_exclude_patterns(self, mock_rclone, mock_makedirs, mock_open_builtin,
-                                                         mock_tempfile, sample_config, mock_rclone_config_file, capsys):
-        """Test sync operation with exclude patterns."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.sync.return_value = None
-        
-        icloud_ops = CloudSyncOperations(sample_config)
+        assert os.environ.get('RCLONE_CONFIG') == 'old_config_path'
+
+        # Check output
+        assert "Starting sync from remote folder" in caplog.text
+        for message in expected_messages:
+            assert message in caplog.text
+
+    @pytest.mark.parametrize("exclude_patterns, expected_excludes", [
+        ([".DS_Store", "*.tmp"], [".DS_Store", "*.tmp"]),
+        ([], list(SyncConfig.DEFAULT_EXCLUDE_PATTERNS)),
+    ], ids=["custom", "defaults"])
+    def test_execute_sync_operation_exclude_patterns(self, mock_makedirs, icloud_ops, mock_rclone, mock_rclone_config_file,
+                                                     sample_config, caplog, exclude_patterns, expected_excludes):
+        """Test that each exclude pattern becomes its own --exclude argument."""
+        # An empty list falls back to the default patterns
+        icloud_ops.config = _derive(sample_config, exclude_patterns=list(exclude_patterns))
+
         remote_path = "iclouddrive:Documents/TestFolder"
         icloud_ops._execute_sync_operation(remote_path)
-        
-        # Verify sync was called
-        sync_call_args = mock_rclone.sync.call_args
-        args = sync_call_args[1]['args']
-        
+
+        args = mock_rclone.sync.call_args[1]['args']
+
         # Check that exclude patterns are properly formatted
-        exclude_indices = [i for i, arg in enumerate(args) if arg == '--exclude']
-        assert len(exclude_indices) == 2  # Two exclude patterns
-        assert args[exclude_indices[0] + 1] == '.DS_Store'
-        assert args[exclude_indices[1] + 1] == '*.tmp'
-        
+        exclude_args = [args[i + 1] for i, arg in enumerate(args) if arg == '--exclude']
+        assert exclude_args == expected_excludes
+
         # Check other required arguments
-        assert '--config' in args
-        assert mock_rclone_config_file.name in args
-        assert '--transfers' in args
-        assert '3' in args
-        assert '--checkers' in args
-        assert '4' in args
-        
+        assert {'--config', mock_rclone_config_file.name, '--transfers', '3', '--checkers', '4'}.issubset(args)
+
         # Check output
-        captured = capsys.readouterr()
-        assert "Excluding 2 patterns: .DS_Store, *.tmp" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.makedirs')
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_execute_sync_operation_no_exclude_patterns(self, mock_rclone, mock_makedirs, mock_open_builtin,
-                                                       mock_tempfile, mock_rclone_config_file):
-        """Test sync operation with only default exclude patterns."""
-        # Create config without additional exclude patterns (still gets defaults)
-        config = SyncConfig(
-            git_repo_path="/tmp/test_repo",
-            rclone_config_content="test config",
-            rclone_remote_folder="Documents/TestFolder"
-        )
-        
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.sync.return_value = None
-        
-        icloud_ops = CloudSyncOperations(config)
-        remote_path = "iclouddrive:Documents/TestFolder"
-        icloud_ops._execute_sync_operation(remote_path)
-        
-        # Verify sync was called with default exclude patterns only
-        sync_call_args = mock_rclone.sync.call_args
-        args = sync_call_args[1]['args']
-        
-        # Should contain default --exclude arguments for git files
-        assert '--exclude' in args
-        # Verify some default excludes are present
-        exclude_args = [args[i+1] for i, arg in enumerate(args) if arg == '--exclude']
-        assert "'.git/'" in exclude_args
-        assert "'.gitmodules'" in exclude_args
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.walk')
-    @patch('sync_icloud_git.cloud_operations.os.path.exists')
-    def test_count_synced_files(self, mock_exists, mock_walk, mock_open_builtin, mock_tempfile,
-                               sample_config, mock_rclone_config_file):
+        assert f"Excluding {len(expected_excludes)} patterns: {', '.join(expected_excludes[:8])}" in caplog.text
+
+    def test_count_synced_files(self, icloud_ops, tmp_path):
         """Test counting synced files."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_exists.return_value = True
-        mock_walk.return_value = [
-            ('/tmp/test_repo', ['subfolder'], ['file1.txt', 'file2.txt']),
-            ('/tmp/test_repo/subfolder', [], ['file3.txt']),
-            ('/tmp/test_repo/.git', [], ['config'])  # Should be skipped
-        ]
-        
-        icloud_ops = CloudSyncOperations(sample_config)
+        (tmp_path / "subfolder").mkdir()
+        (tmp_path / ".git").mkdir()
+        for name in ("file1.txt", "file2.txt", "subfolder/file3.txt", ".git/config", ".gitignore"):
+            (tmp_path / name).touch()  # .git contents and .git* files should be skipped
+        icloud_ops.git_repo_path = str(tmp_path)
+
         synced_files = icloud_ops._count_synced_files()
-        
+
         expected_files = [
-            '/tmp/test_repo/file1.txt',
-            '/tmp/test_repo/file2.txt',
-            '/tmp/test_repo/subfolder/file3.txt'
+            str(tmp_path / "file1.txt"),
+            str(tmp_path / "file2.txt"),
+            str(tmp_path / "subfolder" / "file3.txt")
         ]
-        assert synced_files == expected_files
+        assert sorted(synced_files) == expected_files
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.path.exists')
-    def test_count_synced_files_no_directory(self, mock_exists, mock_open_builtin, mock_tempfile,
-                                           sample_config, mock_rclone_config_file):
+    def test_count_synced_files_no_directory(self, icloud_ops, tmp_path):
         """Test counting synced files when directory doesn't exist."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_exists.return_value = False
-        
-        icloud_ops = CloudSyncOperations(sample_config)
+        icloud_ops.git_repo_path = str(tmp_path / "missing")
+
         synced_files = icloud_ops._count_synced_files()
-        
+
         assert synced_files == []
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_log_sync_parameters(self, mock_open_builtin, mock_tempfile, sample_config, 
-                                mock_rclone_config_file, capsys):
+    def test_log_sync_parameters(self, shared_icloud_ops, sample_config, caplog):
         """Test logging of sync parameters."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        icloud_ops = CloudSyncOperations(sample_config)
         remote_path = "iclouddrive:Documents/TestFolder"
         args = ['--config', '/tmp/config', '--transfers', '3']
         
-        icloud_ops._log_sync_parameters(remote_path, args)
+        shared_icloud_ops._log_sync_parameters(remote_path, args)
         
         # Check debug output
-        captured = capsys.readouterr()
-        assert "Syncing from" in captured.out
-        assert remote_path in captured.out
-        assert sample_config.git_repo_path in captured.out
-        assert f"Excluding {len(sample_config.exclude_patterns)} patterns:" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_execute_sync_with_library(self, mock_rclone, mock_open_builtin, mock_tempfile,
-                                     sample_config, mock_rclone_config_file, capsys):
+        assert "Syncing from" in caplog.text
+        assert remote_path in caplog.text
+        assert sample_config.git_repo_path in caplog.text
+        assert f"Excluding {len(sample_config.exclude_patterns)} patterns:" in caplog.text
+
+    def test_execute_sync_with_library(self, icloud_ops, mock_rclone, sample_config, caplog):
         """Test direct execution with rclone library."""
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.sync.return_value = None
         
-        icloud_ops = CloudSyncOperations(sample_config)
         remote_path = "iclouddrive:Documents/TestFolder"
         args = ['--config', '/tmp/config']
         
@@ -384,267 +307,185 @@ class TestCloudOperations:
         )
         
         # Check output
-        captured = capsys.readouterr()
-        assert "✅ rclone sync completed!" in captured.out
-        assert "files in repository" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.path.exists')
-    @patch('sync_icloud_git.cloud_operations.os.unlink')
-    def test_cleanup_rclone_config(self, mock_unlink, mock_exists, mock_open_builtin, mock_tempfile,
-                                  mock_rclone_config_file, capsys):
+        assert "✅ rclone sync completed!" in caplog.text
+        assert "files in repository" in caplog.text
+
+    def test_cleanup_rclone_config(self, mock_rclone_config_file, mock_unlink, mock_exists, mock_tempfile,
+                                  verbose_config, caplog):
         """Test cleanup of rclone config file."""
-        mock_tempfile.return_value = mock_rclone_config_file
+        # mock_rclone_config_file comes first so tmp_path is set up before os.path.exists is patched
         mock_exists.return_value = True
         
-        # Create a verbose config to see cleanup messages
-        verbose_config = SyncConfig(
-            git_remote_url="https://github.com/test/repo.git",
-            git_username="testuser",
-            git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
-            git_commit_message="Test commit message",
-            rclone_config_content="[iclouddrive]\ntype = webdav\nurl = https://p123-caldav.icloud.com\nuser = testuser\npass = testpass",
-            rclone_remote_folder="Documents/TestFolder",
-            exclude_patterns=[".DS_Store", "*.tmp"],
-            step="all",
-            verbose=True
-        )
-        
+        # Use a verbose config to see cleanup messages
         icloud_ops = CloudSyncOperations(verbose_config)
-        icloud_ops._cleanup_rclone_config()
+        icloud_ops.close()
         
         # Verify cleanup operations
         mock_exists.assert_called_once_with(mock_rclone_config_file.name)
         mock_unlink.assert_called_once_with(mock_rclone_config_file.name)
         
         # Check output
-        captured = capsys.readouterr()
-        assert "Cleaned up rclone config file" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.os.path.exists')
-    def test_cleanup_rclone_config_file_not_exists(self, mock_exists, mock_open_builtin, mock_tempfile,
-                                                  sample_config, mock_rclone_config_file):
+        assert "Cleaned up rclone config file" in caplog.text
+
+    def test_cleanup_rclone_config_file_not_exists(self, icloud_ops, mock_rclone_config_file, mock_exists):
         """Test cleanup when config file doesn't exist."""
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_exists.return_value = False
         
-        icloud_ops = CloudSyncOperations(sample_config)
-        # Reset the call count after initialization
-        mock_exists.reset_mock()
-        
         icloud_ops._cleanup_rclone_config()
         
         # Should not attempt to unlink
         mock_exists.assert_called_once_with(mock_rclone_config_file.name)
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_repr(self, mock_open_builtin, mock_tempfile, sample_config, mock_rclone_config_file):
+    def test_repr(self, shared_icloud_ops, sample_config):
         """Test string representation of ICloudOperations."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        icloud_ops = CloudSyncOperations(sample_config)
-        repr_str = repr(icloud_ops)
+        repr_str = repr(shared_icloud_ops)
 
         expected = f"CloudSyncOperations(git_repo_path='{sample_config.git_repo_path}', rclone_remote_name='{sample_config.rclone_remote_name}', rclone_remote_folder='{sample_config.rclone_remote_folder}')"
         assert repr_str == expected
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_del_cleanup(self, mock_open_builtin, mock_tempfile, sample_config, mock_rclone_config_file):
-        """Test cleanup during object destruction."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        with patch.object(ICloudOperations, '_cleanup_rclone_config') as mock_cleanup:
-            icloud_ops = CloudSyncOperations(sample_config)
-            del icloud_ops
-            mock_cleanup.assert_called_once()
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_del_cleanup_error(self, mock_open_builtin, mock_tempfile, sample_config, mock_rclone_config_file):
-        """Test cleanup error handling during object destruction."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        
-        with patch.object(ICloudOperations, '_cleanup_rclone_config', side_effect=OSError("Cleanup failed")):
-            icloud_ops = CloudSyncOperations(sample_config)
-            # Should not raise exception during deletion
-            del icloud_ops
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_edge_case_empty_remote_folder(self, mock_rclone, mock_open_builtin, mock_tempfile, mock_rclone_config_file):
+    def test_close_cleanup(self, icloud_ops, monkeypatch):
+        """Test that close() removes the rclone config file."""
+        mock_cleanup = Mock()
+        monkeypatch.setattr(icloud_ops, '_cleanup_rclone_config', mock_cleanup)
+
+        icloud_ops.close()
+
+        mock_cleanup.assert_called_once()
+        assert icloud_ops.rclone_config_file is None
+
+    def test_context_manager_cleanup(self, icloud_ops, monkeypatch):
+        """Test that leaving a with block closes the instance, even when the block raises."""
+        mock_cleanup = Mock()
+        monkeypatch.setattr(icloud_ops, '_cleanup_rclone_config', mock_cleanup)
+
+        with pytest.raises(RuntimeError, match="Sync failed"):
+            with icloud_ops as ops:
+                assert ops is icloud_ops
+                mock_cleanup.assert_not_called()
+                raise RuntimeError("Sync failed")
+
+        mock_cleanup.assert_called_once()
+
+    def test_edge_case_empty_remote_folder(self, mock_tempfile, mock_rclone, tmp_path):
         """Test behavior with empty remote folder."""
         config = SyncConfig(
-            git_repo_path="/tmp/test_repo",
+            git_repo_path=str(tmp_path / "test_repo"),
             rclone_config_content="test config",
             rclone_remote_folder=""
         )
         
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.ls.return_value = []
         
-        icloud_ops = CloudSyncOperations(config)
-        remote_path = icloud_ops._build_remote_path()
+        with CloudSyncOperations(config) as icloud_ops:
+            remote_path = icloud_ops._build_remote_path()
         
         assert remote_path == "iclouddrive:"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_edge_case_special_characters_in_folder(self, mock_rclone, mock_open_builtin, mock_tempfile, mock_rclone_config_file):
+    def test_edge_case_special_characters_in_folder(self, mock_tempfile, mock_rclone, tmp_path):
         """Test behavior with special characters in folder name."""
         config = SyncConfig(
-            git_repo_path="/tmp/test_repo",
+            git_repo_path=str(tmp_path / "test_repo"),
             rclone_config_content="test config",
             rclone_remote_folder="Documents/Test Folder (2023) & More!"
         )
         
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.ls.return_value = ["file1.txt"]
         
-        icloud_ops = CloudSyncOperations(config)
-        remote_path = icloud_ops._build_remote_path()
+        with CloudSyncOperations(config) as icloud_ops:
+            remote_path = icloud_ops._build_remote_path()
         
         assert remote_path == "iclouddrive:Documents/Test Folder (2023) & More!"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_integration_full_sync_workflow(self, mock_rclone, mock_open_builtin, mock_tempfile,
-                                          sample_config, mock_rclone_config_file, capsys):
-        """Test complete sync workflow integration."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.ls.return_value = ["file1.txt", "file2.txt", "folder/file3.txt"]
-        mock_rclone.sync.return_value = None
-        
-        with patch('sync_icloud_git.cloud_operations.os.makedirs') as mock_makedirs:
-            icloud_ops = CloudSyncOperations(sample_config)
-            
-            # Test connection first
-            file_count = icloud_ops.test_icloud_connection()
-            assert file_count == 3
-            
-            # Test full sync
-            icloud_ops.sync_from_icloud_to_repo()
-            
-            # Verify all operations
-            mock_makedirs.assert_called_with(sample_config.git_repo_path, exist_ok=True)
-            assert mock_rclone.ls.call_count == 2  # Once for test, once for sync
-            mock_rclone.sync.assert_called_once()
-            
-            # Check final output
-            captured = capsys.readouterr()
-            assert "✅ Found 3 items in remote folder" in captured.out
-            assert "✅ rclone sync completed!" in captured.out
-
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_configurable_remote_name_nextcloud(self, mock_open_builtin, mock_tempfile, mock_rclone_config_file):
+    def test_configurable_remote_name_nextcloud(self, mock_tempfile, tmp_path):
         """Test CloudSyncOperations with Nextcloud remote name."""
-        mock_tempfile.return_value = mock_rclone_config_file
-
         nextcloud_config = SyncConfig(
             git_remote_url="https://github.com/test/repo.git",
             git_username="testuser",
             git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
+            git_repo_path=str(tmp_path / "test_repo"),
             rclone_config_content="[nextcloud]\ntype = webdav\nurl = https://cloud.example.com\nvendor = nextcloud",
             rclone_remote_folder="Documents/TestFolder",
             rclone_remote_name="nextcloud",
             step="all"
         )
 
-        cloud_ops = CloudSyncOperations(nextcloud_config)
-        remote_path = cloud_ops._build_remote_path()
+        with CloudSyncOperations(nextcloud_config) as cloud_ops:
+            remote_path = cloud_ops._build_remote_path()
 
         assert cloud_ops.rclone_remote_name == "nextcloud"
         assert remote_path == "nextcloud:Documents/TestFolder"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_configurable_remote_name_gdrive(self, mock_open_builtin, mock_tempfile, mock_rclone_config_file):
+    def test_configurable_remote_name_gdrive(self, mock_tempfile, tmp_path):
         """Test CloudSyncOperations with Google Drive remote name."""
-        mock_tempfile.return_value = mock_rclone_config_file
-
         gdrive_config = SyncConfig(
             git_remote_url="https://github.com/test/repo.git",
             git_username="testuser",
             git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
+            git_repo_path=str(tmp_path / "test_repo"),
             rclone_config_content="[gdrive]\ntype = drive\nclient_id = xxx",
             rclone_remote_folder="MyFolder",
             rclone_remote_name="gdrive",
             step="all"
         )
 
-        cloud_ops = CloudSyncOperations(gdrive_config)
-        remote_path = cloud_ops._build_remote_path()
+        with CloudSyncOperations(gdrive_config) as cloud_ops:
+            remote_path = cloud_ops._build_remote_path()
 
         assert cloud_ops.rclone_remote_name == "gdrive"
         assert remote_path == "gdrive:MyFolder"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    def test_default_remote_name_backward_compatibility(self, mock_open_builtin, mock_tempfile, mock_rclone_config_file):
+    def test_default_remote_name_backward_compatibility(self, mock_tempfile, tmp_path):
         """Test that default remote name is 'iclouddrive' for backward compatibility."""
-        mock_tempfile.return_value = mock_rclone_config_file
-
         # Config without explicit remote name should default to 'iclouddrive'
         config_without_remote_name = SyncConfig(
             git_remote_url="https://github.com/test/repo.git",
             git_username="testuser",
             git_pat="test_token",
-            git_repo_path="/tmp/test_repo",
+            git_repo_path=str(tmp_path / "test_repo"),
             rclone_config_content="[iclouddrive]\ntype = webdav",
             rclone_remote_folder="Documents/TestFolder",
             step="all"
         )
 
-        cloud_ops = CloudSyncOperations(config_without_remote_name)
-        remote_path = cloud_ops._build_remote_path()
+        with CloudSyncOperations(config_without_remote_name) as cloud_ops:
+            remote_path = cloud_ops._build_remote_path()
 
         assert cloud_ops.rclone_remote_name == "iclouddrive"
         assert remote_path == "iclouddrive:Documents/TestFolder"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_backward_compatibility_alias_icloud_operations(self, mock_rclone, mock_open_builtin, mock_tempfile,
-                                                           sample_config, mock_rclone_config_file):
-        """Test that ICloudOperations alias works for backward compatibility."""
-        mock_tempfile.return_value = mock_rclone_config_file
-        mock_rclone.ls.return_value = ["file1.txt"]
 
-        # ICloudOperations should be an alias to CloudSyncOperations
-        ops = ICloudOperations(sample_config)
+class TestBackwardCompatibility:
+    """Test cases for the deprecated ICloudOperations names."""
 
-        assert isinstance(ops, CloudSyncOperations)
-        assert ops.__class__.__name__ == "CloudSyncOperations"
+    @pytest.fixture(scope='class')
+    @classmethod
+    def patched_cloud_ops(cls, tmp_path_factory):
+        """Patch rclone config file creation and directory setup once for the whole class."""
+        mock_file = Mock()
+        mock_file.name = str(tmp_path_factory.mktemp("rclone") / "rclone.conf")
+        with patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile', return_value=mock_file) as mock_tempfile, \
+             patch('sync_icloud_git.cloud_operations.os.makedirs') as mock_makedirs:
+            yield mock_tempfile, mock_makedirs
+
+    def test_backward_compatibility_alias_icloud_operations(self, patched_cloud_ops, sample_config):
+        """Test that ICloudOperations alias works for backward compatibility."""
+        # ICloudOperations should be an alias to CloudSyncOperations
+        with ICloudOperations(sample_config) as ops:
+            assert isinstance(ops, CloudSyncOperations)
+            assert ops.__class__.__name__ == "CloudSyncOperations"
 
-    @patch('sync_icloud_git.cloud_operations.tempfile.NamedTemporaryFile')
-    @patch('builtins.open', new_callable=mock_open, read_data="config content")
-    @patch('sync_icloud_git.cloud_operations.rclone')
-    def test_backward_compatibility_method_aliases(self, mock_rclone, mock_open_builtin, mock_tempfile,
-                                                   sample_config, mock_rclone_config_file):
+    def test_backward_compatibility_method_aliases(self, patched_cloud_ops, mock_rclone, sample_config):
         """Test that deprecated method names work for backward compatibility."""
-        mock_tempfile.return_value = mock_rclone_config_file
         mock_rclone.ls.return_value = ["file1.txt"]
         mock_rclone.sync.return_value = None
 
-        ops = CloudSyncOperations(sample_config)
-
-        # Test deprecated method test_icloud_connection()
-        with patch('sync_icloud_git.cloud_operations.os.makedirs'):
+        with CloudSyncOperations(sample_config) as ops:
+            # Test deprecated method test_icloud_connection()
             file_count = ops.test_icloud_connection()
             assert file_count == 1
 
-        # Test deprecated method sync_from_icloud_to_repo()
-        with patch('sync_icloud_git.cloud_operations.os.makedirs'):
+            # Test deprecated method sync_from_icloud_to_repo()
             ops.sync_from_icloud_to_repo()
             mock_rclone.sync.assert_called_once()
+
+            assert mock_rclone.ls.call_count == 2  # Once for test, once for sync
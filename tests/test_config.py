@@ -3,12 +3,45 @@ import os
 import pytest
 import tempfile
 from unittest.mock import patch, Mock
-from sync_icloud_git.config import SyncConfig
+from sync_icloud_git.config import ENV_PREFIX, SyncConfig
+
+# Environment providing every required setting; tests adjust it per case through base_env
+BASE_ENV = {
+    'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
+    'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
+    'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
+    'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
+    'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
+}
 
 
 class TestSyncConfig:
     """Test cases for SyncConfig class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_config_cache(self):
+        """Ensure every test loads its configuration from scratch."""
+        SyncConfig.clear_cache()
+        SyncConfig._refresh_env_snapshot()
+        yield
+        SyncConfig.clear_cache()
+        SyncConfig._refresh_env_snapshot()
+
+    @pytest.fixture
+    def clean_env(self, monkeypatch):
+        """Remove any SYNC_ICLOUD_GIT__* variables inherited from the outer environment."""
+        for name in list(os.environ):
+            if name.startswith(ENV_PREFIX):
+                monkeypatch.delenv(name)
+        return monkeypatch
+
+    @pytest.fixture
+    def base_env(self, clean_env):
+        """Set BASE_ENV; tests apply their own changes with setenv/delenv on the returned monkeypatch."""
+        for name, value in BASE_ENV.items():
+            clean_env.setenv(name, value)
+        return clean_env
+
     def test_default_values(self):
         """Test that default values are set correctly."""
         config = SyncConfig()
@@ -17,7 +50,7 @@ class TestSyncConfig:
         assert config.git_commit_message == SyncConfig.DEFAULT_GIT_COMMIT_MESSAGE
         assert config.git_commit_username == SyncConfig.DEFAULT_GIT_COMMIT_USERNAME
         assert config.git_commit_email == SyncConfig.DEFAULT_GIT_COMMIT_EMAIL
-        assert config.exclude_patterns == SyncConfig.DEFAULT_EXCLUDE_PATTERNS
+        assert config.exclude_patterns == list(SyncConfig.DEFAULT_EXCLUDE_PATTERNS)
         assert config.step == 'all'
         assert config.git_remote_url is None
         assert config.git_username is None
@@ -30,7 +63,7 @@ class TestSyncConfig:
         assert SyncConfig.DEFAULT_GIT_COMMIT_MESSAGE == "Sync git with iCloud Drive"
         assert SyncConfig.DEFAULT_GIT_COMMIT_USERNAME == "Sync Bot"
         assert SyncConfig.DEFAULT_GIT_COMMIT_EMAIL == "sync-bot@example.com"
-        assert isinstance(SyncConfig.DEFAULT_EXCLUDE_PATTERNS, list)
+        assert isinstance(SyncConfig.DEFAULT_EXCLUDE_PATTERNS, tuple)
         assert len(SyncConfig.DEFAULT_EXCLUDE_PATTERNS) > 0
         assert "'.git/'" in SyncConfig.DEFAULT_EXCLUDE_PATTERNS
         assert "'.gitignore'" in SyncConfig.DEFAULT_EXCLUDE_PATTERNS
@@ -74,164 +107,137 @@ class TestSyncConfig:
         
         assert config.git_repo_path == SyncConfig.DEFAULT_GIT_REPO_PATH
         assert config.git_commit_message == SyncConfig.DEFAULT_GIT_COMMIT_MESSAGE
-        assert config.exclude_patterns == SyncConfig.DEFAULT_EXCLUDE_PATTERNS
+        assert config.exclude_patterns == list(SyncConfig.DEFAULT_EXCLUDE_PATTERNS)
         assert config.step == 'all'
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_with_all_env_vars(self):
+    def test_load_config_with_all_env_vars(self, base_env):
         """Test loading configuration from environment variables."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__GIT_REPO_PATH': '/env/repo/path',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_MESSAGE': 'Env commit message',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            config = SyncConfig.load_config()
-            
-            assert config.git_remote_url == 'https://env.test.com/repo.git'
-            assert config.git_username == 'envuser'
-            assert config.git_pat == 'envtoken'
-            assert config.git_repo_path == '/env/repo/path'
-            assert config.git_commit_message == 'Env commit message'
-            assert config.rclone_config_content == 'env_rclone_config'
-            assert config.rclone_remote_folder == 'env_folder'
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_REPO_PATH', '/env/repo/path')
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_MESSAGE', 'Env commit message')
+        
+        config = SyncConfig.load_config()
+        
+        assert config.git_remote_url == 'https://env.test.com/repo.git'
+        assert config.git_username == 'envuser'
+        assert config.git_pat == 'envtoken'
+        assert config.git_repo_path == '/env/repo/path'
+        assert config.git_commit_message == 'Env commit message'
+        assert config.rclone_config_content == 'env_rclone_config'
+        assert config.rclone_remote_folder == 'env_folder'
 
     @patch('sys.argv', ['sync-icloud-git', '--step=clone'])
-    def test_load_config_with_command_line_args(self):
+    def test_load_config_with_command_line_args(self, base_env):
         """Test loading configuration from command line arguments."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
+        config = SyncConfig.load_config()
+        assert config.step == 'clone'
+
+    @patch('sys.argv', ['sync-icloud-git', '--step', 'update'])
+    def test_load_config_step_only_skips_argparse(self, base_env):
+        """Test that a lone --step option is handled without building the argparse parser."""
+        with patch('sync_icloud_git.config._get_parser') as mock_get_parser:
             config = SyncConfig.load_config()
-            assert config.step == 'clone'
+            
+            assert config.step == 'update'
+            assert config.git_username == 'envuser'
+            mock_get_parser.assert_not_called()
 
     @patch('sys.argv', ['sync-icloud-git', '--git-commit-message', 'CLI commit message'])
-    def test_load_config_cli_overrides_env(self):
+    def test_load_config_cli_overrides_env(self, base_env):
         """Test that CLI arguments override environment variables."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_MESSAGE': 'Env commit message',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            config = SyncConfig.load_config()
-            assert config.git_commit_message == 'CLI commit message'
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_MESSAGE', 'Env commit message')
+        
+        config = SyncConfig.load_config()
+        assert config.git_commit_message == 'CLI commit message'
 
     @patch('sys.argv', ['sync-icloud-git', '--exclude-patterns', 'pattern1', 'pattern2'])
-    def test_load_config_with_exclude_patterns(self):
+    def test_load_config_with_exclude_patterns(self, base_env):
         """Test loading configuration with additional exclude patterns."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            config = SyncConfig.load_config()
-            
-            # Should contain default patterns plus additional ones
-            assert len(config.exclude_patterns) == len(SyncConfig.DEFAULT_EXCLUDE_PATTERNS) + 2
-            assert 'pattern1' in config.exclude_patterns
-            assert 'pattern2' in config.exclude_patterns
-            # Should still contain default patterns
-            assert "'.git/'" in config.exclude_patterns
+        config = SyncConfig.load_config()
+        
+        # Should contain default patterns plus additional ones
+        assert len(config.exclude_patterns) == len(SyncConfig.DEFAULT_EXCLUDE_PATTERNS) + 2
+        assert 'pattern1' in config.exclude_patterns
+        assert 'pattern2' in config.exclude_patterns
+        # Should still contain default patterns
+        assert "'.git/'" in config.exclude_patterns
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_required_args(self):
+    def test_load_config_missing_required_args(self, clean_env):
         """Test that missing required arguments raise appropriate errors."""
-        # Clear environment variables
-        env_vars = {}
-        
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_git_remote_url(self):
+    def test_load_config_missing_git_remote_url(self, base_env):
         """Test error when git remote URL is missing."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
+        base_env.delenv('SYNC_ICLOUD_GIT__GIT_REMOTE_URL')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_git_username(self):
+    def test_load_config_missing_git_username(self, base_env):
         """Test error when git username is missing."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
+        base_env.delenv('SYNC_ICLOUD_GIT__GIT_USERNAME')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_git_pat(self):
+    def test_load_config_missing_git_pat(self, base_env):
         """Test error when git PAT is missing."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
+        base_env.delenv('SYNC_ICLOUD_GIT__GIT_PAT')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_rclone_config(self):
+    def test_load_config_missing_rclone_config(self, base_env):
         """Test error when rclone config is missing."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
+        base_env.delenv('SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_load_config_missing_rclone_remote_folder(self):
+    def test_load_config_missing_rclone_remote_folder(self, base_env):
         """Test error when rclone remote folder is missing."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config'
-        }
+        base_env.delenv('SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER')
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
+
+    def test_from_env(self, base_env):
+        """Test loading configuration from environment variables without argparse."""
+        base_env.setenv('SYNC_ICLOUD_GIT__RCLONE_REMOTE_NAME', 'nextcloud')
+        
+        config = SyncConfig.from_env()
+        
+        assert config.git_remote_url == 'https://env.test.com/repo.git'
+        assert config.rclone_remote_name == 'nextcloud'
+        assert config.git_commit_message == SyncConfig.DEFAULT_GIT_COMMIT_MESSAGE
+        assert config.step == 'all'
+        assert config.verbose is False
+
+    def test_from_env_missing_required_raises_value_error(self, base_env):
+        """Test that from_env reports missing settings with ValueError instead of exiting."""
+        base_env.delenv('SYNC_ICLOUD_GIT__GIT_PAT')
+        
+        with pytest.raises(ValueError, match="Missing required settings: Git Personal Access Token"):
+            SyncConfig.from_env()
+
+    def test_from_env_reports_all_missing_settings(self, base_env):
+        """Test that every missing setting is named in one error instead of only the first."""
+        base_env.delenv('SYNC_ICLOUD_GIT__GIT_USERNAME')
+        base_env.delenv('SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER')
+        
+        with pytest.raises(ValueError) as exc:
+            SyncConfig.from_env()
+        
+        message = str(exc.value)
+        assert "Git username (--git-username or SYNC_ICLOUD_GIT__GIT_USERNAME)" in message
+        assert "Rclone remote folder (--rclone-remote-folder or SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER)" in message
 
     def test_repr_masks_sensitive_data(self):
         """Test that __repr__ masks sensitive information."""
@@ -271,20 +277,16 @@ class TestSyncConfig:
             config = SyncConfig(step=step)
             assert config.step == step
 
+    def test_invalid_step_in_constructor_raises_value_error(self):
+        """Test that constructing SyncConfig with an unknown step fails."""
+        with pytest.raises(ValueError, match="Invalid step 'deploy'"):
+            SyncConfig(step='deploy')
+
     @patch('sys.argv', ['sync-icloud-git', '--step=invalid'])
-    def test_invalid_step_choice(self):
+    def test_invalid_step_choice(self, base_env):
         """Test that invalid step choice raises error."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://env.test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'envuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'envtoken',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'env_rclone_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'env_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            with pytest.raises(SystemExit):
-                SyncConfig.load_config()
+        with pytest.raises(SystemExit):
+            SyncConfig.load_config()
 
     def test_exclude_patterns_copy_behavior(self):
         """Test that exclude patterns are properly copied and don't affect defaults."""
@@ -303,6 +305,28 @@ class TestSyncConfig:
         # Verify the default list itself wasn't modified
         assert len(SyncConfig.DEFAULT_EXCLUDE_PATTERNS) == original_default_count
 
+    @patch('sys.argv', ['sync-icloud-git'])
+    def test_load_config_is_cached(self, base_env):
+        """Test that repeated load_config calls reuse the cached configuration."""
+        config = SyncConfig.load_config()
+        assert SyncConfig.load_config() is config
+        
+        # Environment changes are picked up once the snapshot is refreshed
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_USERNAME', 'otheruser')
+        assert SyncConfig.load_config() is config
+        SyncConfig._refresh_env_snapshot()
+        reloaded = SyncConfig.load_config()
+        assert reloaded is not config
+        assert reloaded.git_username == 'otheruser'
+
+    def test_default_exclude_patterns_are_read_only(self):
+        """Test that the shared default patterns cannot be mutated by accident."""
+        with pytest.raises(AttributeError):
+            SyncConfig.DEFAULT_EXCLUDE_PATTERNS.append("'new_pattern'")
+        
+        with pytest.raises(TypeError):
+            SyncConfig.DEFAULT_EXCLUDE_PATTERNS[0] = "'new_pattern'"
+
     def test_git_repo_path_default_behavior(self):
         """Test git repo path default behavior."""
         config = SyncConfig()
@@ -320,65 +344,56 @@ class TestSyncConfig:
         config.git_commit_message = "Modified message"
         assert config.git_commit_message == "Modified message"
 
+    def test_config_rejects_unknown_attributes(self):
+        """Test that misspelled attributes fail instead of being silently added."""
+        config = SyncConfig()
+        
+        with pytest.raises(AttributeError):
+            config.git_comit_message = "Typo"
+
     @patch('sys.argv', ['sync-icloud-git'])
-    def test_git_commit_identity_environment_variables(self):
+    def test_git_commit_identity_environment_variables(self, base_env):
         """Test that git commit username and email are loaded from environment variables."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'testuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'testtoken',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_USERNAME': 'Environment User',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_EMAIL': 'env-user@example.com',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'test_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'test_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            config = SyncConfig.load_config()
-            
-            # Test that environment variables override defaults
-            assert config.git_commit_username == 'Environment User'
-            assert config.git_commit_email == 'env-user@example.com'
-            
-            # Test that other values are still loaded correctly
-            assert config.git_remote_url == 'https://test.com/repo.git'
-            assert config.git_username == 'testuser'
-            assert config.git_pat == 'testtoken'
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_USERNAME', 'Environment User')
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_EMAIL', 'env-user@example.com')
+        
+        config = SyncConfig.load_config()
+        
+        # Test that environment variables override defaults
+        assert config.git_commit_username == 'Environment User'
+        assert config.git_commit_email == 'env-user@example.com'
+        
+        # Test that other values are still loaded correctly
+        assert config.git_remote_url == 'https://env.test.com/repo.git'
+        assert config.git_username == 'envuser'
+        assert config.git_pat == 'envtoken'
 
     @patch('sys.argv', [
         'sync-icloud-git', 
         '--git-commit-username', 'CLI User',
         '--git-commit-email', 'cli-user@example.com'
     ])
-    def test_git_commit_identity_command_line_override(self):
+    def test_git_commit_identity_command_line_override(self, base_env):
         """Test that command line arguments override environment variables for git commit identity."""
-        env_vars = {
-            'SYNC_ICLOUD_GIT__GIT_REMOTE_URL': 'https://test.com/repo.git',
-            'SYNC_ICLOUD_GIT__GIT_USERNAME': 'testuser',
-            'SYNC_ICLOUD_GIT__GIT_PAT': 'testtoken',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_USERNAME': 'Environment User',
-            'SYNC_ICLOUD_GIT__GIT_COMMIT_EMAIL': 'env-user@example.com',
-            'SYNC_ICLOUD_GIT__RCLONE_CONFIG_CONTENT': 'test_config',
-            'SYNC_ICLOUD_GIT__RCLONE_REMOTE_FOLDER': 'test_folder'
-        }
-        
-        with patch.dict(os.environ, env_vars):
-            config = SyncConfig.load_config()
-            
-            # Test that CLI arguments override environment variables
-            assert config.git_commit_username == 'CLI User'
-            assert config.git_commit_email == 'cli-user@example.com'
-            
-            # Test that other environment variables are still used
-            assert config.git_remote_url == 'https://test.com/repo.git'
-            assert config.git_username == 'testuser'
-            assert config.git_pat == 'testtoken'
-            
-            # Test priority: CLI > env vars > defaults
-            # These should not be the environment values since CLI overrides them
-            assert config.git_commit_username != 'Environment User'
-            assert config.git_commit_email != 'env-user@example.com'
-            
-            # And they should not be the defaults since CLI overrides them
-            assert config.git_commit_username != SyncConfig.DEFAULT_GIT_COMMIT_USERNAME
-            assert config.git_commit_email != SyncConfig.DEFAULT_GIT_COMMIT_EMAIL
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_USERNAME', 'Environment User')
+        base_env.setenv('SYNC_ICLOUD_GIT__GIT_COMMIT_EMAIL', 'env-user@example.com')
+        
+        config = SyncConfig.load_config()
+        
+        # Test that CLI arguments override environment variables
+        assert config.git_commit_username == 'CLI User'
+        assert config.git_commit_email == 'cli-user@example.com'
+        
+        # Test that other environment variables are still used
+        assert config.git_remote_url == 'https://env.test.com/repo.git'
+        assert config.git_username == 'envuser'
+        assert config.git_pat == 'envtoken'
+        
+        # Test priority: CLI > env vars > defaults
+        # These should not be the environment values since CLI overrides them
+        assert config.git_commit_username != 'Environment User'
+        assert config.git_commit_email != 'env-user@example.com'
+        
+        # And they should not be the defaults since CLI overrides them
+        assert config.git_commit_username != SyncConfig.DEFAULT_GIT_COMMIT_USERNAME
+        assert config.git_commit_email != SyncConfig.DEFAULT_GIT_COMMIT_EMAIL